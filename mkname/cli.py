@@ -5,6 +5,7 @@ cli
 Command line interface for the mkname package.
 """
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence, Union
 
@@ -75,9 +76,11 @@ def write_output(lines: Union[Sequence[str], str]) -> None:
 
 
 # Command parsing.
-def parse_cli() -> None:
-    """Response to commands passed through the CLI."""
-    # Set up the command line interface.
+@lru_cache(maxsize=1)
+def _build_parser() -> ArgumentParser:
+    """Build the parser for the command line interface. The parser
+    only needs to be built once, so it is cached.
+    """
     p = ArgumentParser(
         description='Randomized name construction.',
         prog='mkname',
@@ -143,6 +146,13 @@ def parse_cli() -> None:
         action='store',
         type=int
     )
+    return p
+
+
+def parse_cli() -> None:
+    """Response to commands passed through the CLI."""
+    # Set up the command line interface.
+    p = _build_parser()
     args = p.parse_args()
 
     # Set up the configuration.
@@ -38,7 +38,7 @@ def connect_db(location: Union[str, Path]) -> sqlite3.Connection:
         raise ValueError(msg)
 
     # Make and return the database connection.
-    con = sqlite3.Connection(path)
+    con = sqlite3.connect(path)
     return con
 
 
@@ -89,6 +89,20 @@ def _run_query_for_single_column(con: sqlite3.Connection,
     return tuple(text[0] for text in result)
 
 
+def _run_query_for_names(con: sqlite3.Connection,
+                         query: str,
+                         params: tuple[str, ...] = ()) -> tuple[Name, ...]:
+    """Run the query and return the results as names."""
+    cur = con.cursor()
+    cur.row_factory = _name_factory
+    return tuple(cur.execute(query, params))
+
+
+def _name_factory(cursor: sqlite3.Cursor, row: tuple) -> Name:
+    """Build a :class:Name from a row returned by the database."""
+    return Name._make(row)
+
+
 # Serialization/deserialization functions.
 @makes_connection
 def get_names(con: sqlite3.Connection) -> tuple[Name, ...]:
@@ -109,8 +123,7 @@ def get_names(con: sqlite3.Connection) -> tuple[Name, ...]:
         (Name(id=1, name='spam', source='eggs', ... kind='given'))
     """
     query = 'select * from names'
-    result = con.execute(query)
-    return tuple(Name(*args) for args in result)
+    return _run_query_for_names(con, query)
 
 
 @makes_connection
@@ -137,8 +150,7 @@ def get_names_by_kind(con: sqlite3.Connection, kind: str) -> tuple[Name, ...]:
     """
     query = 'select * from names where kind == ?'
     params = (kind, )
-    result = con.execute(query, params)
-    return tuple(Name(*args) for args in result)
+    return _run_query_for_names(con, query, params)
 
 
 @makes_connection
@@ -6,6 +6,7 @@ Basic initialization functions for :mod:`mkname`.
 """
 from configparser import ConfigParser
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib.resources import files
 from pathlib import Path
 from typing import Union
@@ -112,18 +113,43 @@ def get_default_config() -> Config:
 
 
 def read_config(path: Path) -> Config:
-    """Read the configuration file at the given path.
+    """Read the configuration file at the given path. The parsed
+    file is cached until the file is modified, so reading the same
+    file again doesn't parse it again.
 
     :param path: The path to the configuration file.
     :return: The configuration as a :class:`dict`.
     :rtype: dict
     """
+    path = Path(path)
+    if not path.is_file():
+        return _parse_config(path)
+    stat = path.stat()
+    config = _cached_parse_config(
+        path.resolve(), stat.st_mtime_ns, stat.st_size
+    )
+    return {k: dict(v) for k, v in config.items()}
+
+
+def _parse_config(path: Path) -> Config:
+    """Parse the configuration file at the given path."""
     parser = ConfigParser()
     parser.read(path)
     sections = ['mkname', 'mkname_files']
     return {k: dict(parser[k]) for k in parser if k in sections}
 
 
+@lru_cache(maxsize=16)
+def _cached_parse_config(path: Path, mtime: int, size: int) -> Config:
+    """Parse the configuration file at the given path. The path must
+    be resolved, so a relative path read from different working
+    directories doesn't share a cache entry. The modification time
+    and size of the file are part of the cache key, so changes to
+    the file invalidate the cached value.
+    """
+    return _parse_config(path)
+
+
 def read_config_dir(path: Path, config: Union[dict, None] = None) -> Config:
     """Read an "INI" formatted configuration files from a directory.
 
@@ -241,8 +267,11 @@ def get_db_dir(path: Path) -> Path:
     return get_db(path)
 
 
+@lru_cache(maxsize=1)
 def get_default_db() -> Path:
-    """Get the path to the default names database.
+    """Get the path to the default names database. The location of
+    the default database doesn't change while the package is loaded,
+    so the path is cached after the first call.
 
     :return: The path to the default names database as a
         :class:`pathlib.Path`.
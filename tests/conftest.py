@@ -0,0 +1,62 @@
+"""
+conftest
+~~~~~~~~
+
+Common fixtures for the mkname unit tests.
+"""
+import sqlite3
+
+import pytest
+import yadr
+
+from mkname import init
+
+
+# Fixtures.
+@pytest.fixture(scope='session')
+def base_config():
+    """The default configuration, read once per session. Tests that
+    change the configuration should change a copy of it.
+    """
+    return init.get_default_config()
+
+
+@pytest.fixture(scope='session')
+def data_dir(pytestconfig):
+    """The directory containing the test data."""
+    return pytestconfig.rootpath / 'tests' / 'data'
+
+
+@pytest.fixture(scope='session')
+def db_path(data_dir):
+    """The path to the test database."""
+    return data_dir / 'names.db'
+
+
+@pytest.fixture
+def mock_roll(monkeypatch):
+    """Make :func:`yadr.roll` return the given rolls in order. A
+    plain function stands in for the roll rather than a mock, since
+    the calls don't need to be recorded.
+    """
+    def set_rolls(rolls):
+        results = iter(rolls)
+        monkeypatch.setattr(
+            yadr, 'roll', lambda *args, **kwargs: next(results)
+        )
+    return set_rolls
+
+
+@pytest.fixture(scope='session')
+def template_con(db_path):
+    """An in-memory copy of the test database, loaded once per session
+    for other fixtures to clone. The test database is opened read-only
+    and immutable, since the copy is only ever read from it.
+    """
+    uri = f'{db_path.as_uri()}?mode=ro&immutable=1'
+    src = sqlite3.connect(uri, uri=True)
+    con = sqlite3.connect(':memory:')
+    src.backup(con)
+    src.close()
+    yield con
+    con.close()
@@ -4,194 +4,181 @@ test_cli
 
 Unit tests for mkname.cli.
 """
+import sys
+from configparser import ConfigParser
+
 import pytest
 
 from mkname import cli
-from mkname import constants as c
-from mkname import init
-from mkname import mkname as mn
+
+
+# Common data.
+ALL_NAMES = 'spam\nham\ntomato\nwaffles\n'
 
 
 # Fixtures.
 @pytest.fixture
-def testdb(mocker):
-    """Point the unit test to the test instance of the database."""
-    config = init.get_config()
-    config['mkname']['db_path'] = 'tests/data/names.db'
-    mocker.patch('mkname.cli.get_config', return_value=config)
+def testdb(monkeypatch, base_config, db_path):
+    """Point the unit test to the test instance of the database.
+
+    The configuration is copied from the defaults, which are read once
+    per session rather than through :func:`mkname.init.get_config`, so
+    the test doesn't depend on any configuration files staged in the
+    current working directory.
+    """
+    config = {k: dict(v) for k, v in base_config.items()}
+    config['mkname']['db_path'] = str(db_path)
+    monkeypatch.setattr(cli, 'get_config', lambda path='': config)
+    return config
 
 
 @pytest.fixture
-def testletters(mocker):
+def testletters(testdb):
     """Change the consonants and vowels for a test."""
-    config = init.get_config()
-    config['mkname']['db_path'] = 'tests/data/names.db'
-    config['mkname']['consonants'] = 'bcdfghjkmnpqrstvwxz'
-    config['mkname']['vowels'] = 'aeiouyl'
-    mocker.patch('mkname.cli.get_config', return_value=config)
-
+    testdb['mkname']['consonants'] = 'bcdfghjkmnpqrstvwxz'
+    testdb['mkname']['vowels'] = 'aeiouyl'
+    return testdb
 
-# Core test functions.
-def cli_test(mocker, capsys, cmd, roll=None):
-    """Run a standard test of the CLI."""
-    mocker.patch('sys.argv', cmd)
-    if roll:
-        mocker.patch('yadr.roll', side_effect=roll)
 
-    cli.parse_cli()
+@pytest.fixture
+def run_cli(monkeypatch, capsys, mock_roll):
+    """Run the CLI with the given command and return what it wrote
+    to standard out. If rolls are given, :func:`yadr.roll` returns
+    them in order.
+    """
+    monkeypatch.setattr(sys, 'argv', [])
 
-    captured = capsys.readouterr()
-    return captured.out
+    def run(cmd, roll=None):
+        sys.argv[:] = cmd
+        if roll:
+            mock_roll(roll)
+        cli.parse_cli()
+        captured = capsys.readouterr()
+        return captured.out
+    return run
 
 
 # Test cases.
-def test_build_compound_name(mocker, capsys, testdb):
+@pytest.mark.parametrize('cmd,roll,expected', [
+    (
+        ['python -m mkname', '-c'],
+        [3, 2],
+        'Tam\n',
+    ),
+    (
+        ['python -m mkname', '-s 3'],
+        [3, 2, 4, 2, 1, 1],
+        'Athamwaff\n',
+    ),
+    (
+        ['python -m mkname', '-s 4'],
+        [3, 2, 4, 1, 2, 1, 1, 1],
+        'Athamwaffspam\n',
+    ),
+    (
+        ['python -m mkname', '-p'],
+        [3,],
+        'tomato\n',
+    ),
+    (
+        ['python -m mkname', '-p', '-n', '3'],
+        [3, 1, 4],
+        'tomato\nspam\nwaffles\n',
+    ),
+    (
+        ['python -m mkname', '-p', '-m', 'garble'],
+        [3, 5],
+        'Tomadao\n',
+    ),
+], ids=[
+    'compound',
+    'syllables_3',
+    'syllables_4',
+    'pick',
+    'pick_3',
+    'pick_garble',
+])
+def test_build_name(run_cli, testdb, cmd, roll, expected):
     """When called with the -c option, construct a name from
-    compounding two names from the database.
-    """
-    cmd = ['python -m mkname', '-c']
-    roll = [3, 2]
-    result = cli_test(mocker, capsys, cmd, roll)
-    assert result == 'Tam\n'
-
-
-def test_build_syllable_name(mocker, capsys, testdb):
-    """When called with the -s 3 option, construct a name from
-    a syllable from three names in the database.
-    """
-    cmd = ['python -m mkname', '-s 3']
-    roll = [3, 2, 4, 2, 1, 1]
-    result = cli_test(mocker, capsys, cmd, roll)
-    assert result == 'Athamwaff\n'
-
-
-def test_build_syllable_name_4_syllables(mocker, capsys, testdb):
-    """When called with the -s 4 option, construct a name from
-    a syllable from four names in the database.
+    compounding two names from the database. When called with
+    the -s option and a number, construct a name from a syllable
+    from that many names in the database. When called with the -p
+    option, select a random name from the list of names. The -n
+    option sets how many names to create, and the -m option performs
+    the given mod on the names.
     """
-    cmd = ['python -m mkname', '-s 4']
-    roll = [3, 2, 4, 1, 2, 1, 1, 1]
-    result = cli_test(mocker, capsys, cmd, roll)
-    assert result == 'Athamwaffspam\n'
+    result = run_cli(cmd, roll)
+    assert result == expected
 
 
-def test_build_syllable_name_diff_consonants(
-    mocker, capsys, testletters
-):
+def test_build_syllable_name_diff_consonants(run_cli, testletters):
     """The consonants and vowels from the config should affect
     how the name is generated.
     """
     cmd = ['python -m mkname', '-s 1']
     roll = [4, 1]
-    result = cli_test(mocker, capsys, cmd, roll)
+    result = run_cli(cmd, roll)
     assert result == 'Waf\n'
 
 
-def test_culture(mocker, capsys, testdb):
-    """When called with the -k option and a culture, use only
-    names from that culture for the generation.
-    """
-    cmd = ['python -m mkname', '-L', '-k', 'bacon']
-    result = cli_test(mocker, capsys, cmd)
-    assert result == (
-        'spam\n'
-        'ham\n'
-    )
-
-
-def test_first_names(mocker, capsys, testdb):
-    """When called with the -F option, use only given names for
-    the generation.
-    """
-    cmd = ['python -m mkname', '-L', '-f']
-    result = cli_test(mocker, capsys, cmd)
-    assert result == (
-        'spam\n'
-        'ham\n'
-        'waffles\n'
-    )
-
-
-def test_last_name(mocker, capsys, testdb):
-    """When called with -l, only use surnames for the generation."""
-    cmd = ['python -m mkname', '-L', '-l']
-    result = cli_test(mocker, capsys, cmd)
-    assert result == 'tomato\n'
-
-
-def test_list_all_names(mocker, capsys, testdb):
+@pytest.mark.parametrize('cmd,expected', [
+    (
+        ['python -m mkname', '-L'],
+        ALL_NAMES,
+    ),
+    (
+        ['python -m mkname', '-L', '-k', 'bacon'],
+        'spam\nham\n',
+    ),
+    (
+        ['python -m mkname', '-L', '-f'],
+        'spam\nham\nwaffles\n',
+    ),
+    (
+        ['python -m mkname', '-L', '-l'],
+        'tomato\n',
+    ),
+    (
+        ['python -m mkname', '-K'],
+        'bacon\npancakes\nporridge\n',
+    ),
+], ids=[
+    'all',
+    'culture',
+    'given',
+    'surname',
+    'cultures',
+])
+def test_list(run_cli, testdb, cmd, expected):
     """When called with the -L option, write all the names from
-    the database to standard out.
-    """
-    cmd = ['python -m mkname', '-L']
-    result = cli_test(mocker, capsys, cmd)
-    assert result == (
-        'spam\n'
-        'ham\n'
-        'tomato\n'
-        'waffles\n'
-    )
-
-
-def test_list_cultures(mocker, capsys, testdb):
-    """When called with -K, write the unique cultures from the
-    database to standard out.
+    the database to standard out. The -k option limits the names
+    to the given culture, the -f option limits them to given names,
+    and the -l option limits them to surnames. When called with -K,
+    write the unique cultures from the database to standard out.
     """
-    cmd = ['python -m mkname', '-K']
-    result = cli_test(mocker, capsys, cmd)
-    assert result == (
-        'bacon\n'
-        'pancakes\n'
-        'porridge\n'
-    )
-
-
-def test_make_multiple_names(mocker, capsys, testdb):
-    """When called with the -n 3 option, create three names."""
-    cmd = ['python -m mkname', '-p', '-n', '3']
-    roll = [3, 1, 4]
-    result = cli_test(mocker, capsys, cmd, roll)
-    assert result == (
-        'tomato\n'
-        'spam\n'
-        'waffles\n'
-    )
-
-
-def test_modify_name(mocker, capsys, testdb):
-    """When called with the -m garble option, perform the garble
-    mod on the name.
-    """
-    cmd = ['python -m mkname', '-p', '-m', 'garble']
-    roll = [3, 5]
-    result = cli_test(mocker, capsys, cmd, roll)
-    assert result == 'Tomadao\n'
+    result = run_cli(cmd)
+    assert result == expected
 
 
-def test_pick_name(mocker, capsys, testdb):
-    """When called with the -p option, select a random name
-    from the list of names.
-    """
-    cmd = ['python -m mkname', '-p']
-    roll = [3,]
-    result = cli_test(mocker, capsys, cmd, roll)
-    assert result == 'tomato\n'
-
-
-def test_use_config(mocker, capsys):
+def test_use_config(run_cli, monkeypatch, tmp_path, data_dir, db_path):
     """When called with the -C option followed by a path to a
     configuration file, use the configuration in that file when
     running the script.
     """
+    # The test config gives db_path relative to the repository root,
+    # so point a copy of it at the test database before using it.
+    config = ConfigParser()
+    config.read(data_dir / 'test_use_config.cfg')
+    config['mkname']['db_path'] = str(db_path)
+    path = tmp_path / 'test_use_config.cfg'
+    with open(path, 'w') as fh:
+        config.write(fh)
+    monkeypatch.chdir(tmp_path)
+
     cmd = [
         'python -m mkname',
-        '-C', 'tests/data/test_use_config.cfg',
+        '-C', str(path),
         '-L'
     ]
-    result = cli_test(mocker, capsys, cmd)
-    assert result == (
-        'spam\n'
-        'ham\n'
-        'tomato\n'
-        'waffles\n'
-    )
+    result = run_cli(cmd)
+    assert result == ALL_NAMES
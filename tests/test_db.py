@@ -4,7 +4,6 @@ test_db
 
 Unit tests for the mkname.db module.
 """
-import pathlib
 import sqlite3
 
 import pytest
@@ -13,74 +12,88 @@ from mkname import db
 from mkname import model as m
 
 
+# Common data.
+TEST_NAMES = (
+    m.Name(
+        1,
+        'spam',
+        'eggs',
+        'bacon',
+        1970,
+        'sausage',
+        'given'
+    ),
+    m.Name(
+        2,
+        'ham',
+        'eggs',
+        'bacon',
+        1970,
+        'baked beans',
+        'given'
+    ),
+    m.Name(
+        3,
+        'tomato',
+        'mushrooms',
+        'pancakes',
+        2000,
+        'sausage',
+        'surname'
+    ),
+    m.Name(
+        4,
+        'waffles',
+        'mushrooms',
+        'porridge',
+        2000,
+        'baked beans',
+        'given'
+    ),
+)
+
+UNIQUE_VALUES = [
+    pytest.param(
+        db.get_cultures,
+        ('bacon', 'pancakes', 'porridge'),
+        id='cultures'
+    ),
+    pytest.param(
+        db.get_kinds,
+        ('given', 'surname'),
+        id='kinds'
+    ),
+]
+
+
 # Fixtures
 @pytest.fixture
-def con():
-    """Manage a test database connection."""
-    db_path = 'tests/data/names.db'
-    con = sqlite3.Connection(db_path)
+def con(template_con):
+    """Manage a connection to an in-memory copy of the test database."""
+    con = sqlite3.connect(':memory:')
+    template_con.backup(con)
     yield con
     con.close()
 
 
 @pytest.fixture
-def test_db(mocker):
+def test_db(monkeypatch, db_path):
     """Point the default database to the test database."""
-    db_path = 'tests/data/names.db'
-    mocker.patch('mkname.db.get_db', return_value=db_path)
-    yield None
+    monkeypatch.setattr(db, 'get_db', lambda path='': db_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_names():
     """The contents of the test database."""
-    yield (
-        m.Name(
-            1,
-            'spam',
-            'eggs',
-            'bacon',
-            1970,
-            'sausage',
-            'given'
-        ),
-        m.Name(
-            2,
-            'ham',
-            'eggs',
-            'bacon',
-            1970,
-            'baked beans',
-            'given'
-        ),
-        m.Name(
-            3,
-            'tomato',
-            'mushrooms',
-            'pancakes',
-            2000,
-            'sausage',
-            'surname'
-        ),
-        m.Name(
-            4,
-            'waffles',
-            'mushrooms',
-            'porridge',
-            2000,
-            'baked beans',
-            'given'
-        ),
-    )
+    return TEST_NAMES
 
 
 # Connection test cases.
-def test_connect():
+def test_connect(db_path):
     """When given the path to an sqlite3 database, db.connect_db
     should return a connection to the database.
     """
     # Test data and state.
-    db_path = 'tests/data/names.db'
     query = 'select name from names where id = 1;'
 
     # Run test.
@@ -95,13 +108,12 @@ def test_connect():
     assert result == ('spam',)
 
 
-def test_connect_no_file():
+def test_connect_no_file(data_dir):
     """If the given file does not exist, db.connect_db should raise
     a ValueError.
     """
     # Test data and state.
-    db_path = 'tests/data/no_file.db'
-    path = pathlib.Path(db_path)
+    path = data_dir / 'no_file.db'
     if path.is_file():
         msg = f'Remove file at "{path}".'
         raise RuntimeError(msg)
@@ -111,13 +123,10 @@ def test_connect_no_file():
         _ = db.connect_db(path)
 
 
-def test_disconnect():
+def test_disconnect(con):
     """When given a database connection, close it."""
     # Test data and state.
-    db_path = 'tests/data/names.db'
-    con = sqlite3.Connection(db_path)
     query = 'select name from names where id = 1;'
-    result = None
 
     # Run test.
     db.disconnect_db(con)
@@ -127,24 +136,17 @@ def test_disconnect():
         sqlite3.ProgrammingError,
         match='Cannot operate on a closed database.'
     ):
-        result = con.execute(query)
-
-    # Clean up test.
-    if result:
-        con.close()
+        _ = con.execute(query)
 
 
-def test_disconnect_with_pending_changes():
+def test_disconnect_with_pending_changes(con):
     """When given a database connection, raise an exception if
     the connection contains uncommitted changes instead of closing
     the connection.
     """
     # Test data and state.
-    db_path = 'tests/data/names.db'
-    con = sqlite3.Connection(db_path)
     query = "insert into names values (null, 'test', '', '', 0, '', '')"
     _ = con.execute(query)
-    result = None
 
     # Run test and determine result.
     with pytest.raises(
@@ -153,6 +155,9 @@ def test_disconnect_with_pending_changes():
     ):
         db.disconnect_db(con)
 
+    # Clean up test.
+    con.rollback()
+
 
 # Serialization test cases.
 def test_get_names(con, test_names):
@@ -163,11 +168,10 @@ def test_get_names(con, test_names):
     assert db.get_names(con) == test_names
 
 
-def test_get_names_called_with_path(test_names):
+def test_get_names_called_with_path(test_names, db_path):
     """When called with a path to a database, :func:`mkname.db.get_name`
     should return the names in the given database as a tuple.
     """
-    db_path = 'tests/data/names.db'
     assert db.get_names(db_path) == test_names
 
 
@@ -178,127 +182,58 @@ def test_get_names_called_without_connection_or_path(test_db, test_names):
     assert db.get_names() == test_names
 
 
-def test_get_cultures(con):
-    """Given a connection, :func:`mkname.db.get_cultures` should return
-    the list of unique cultures for the names in the given database.
+@pytest.mark.parametrize('fn,expected', UNIQUE_VALUES)
+def test_get_unique_values(con, fn, expected):
+    """Given a connection, :func:`mkname.db.get_cultures` and
+    :func:`mkname.db.get_kinds` should return the unique values
+    for the names in the given database.
     """
-    assert db.get_cultures(con) == (
-        'bacon',
-        'pancakes',
-        'porridge',
-    )
+    assert fn(con) == expected
 
 
-def test_get_cultures_with_path():
-    """Given a path to a database, :func:`mkname.db.get_cultures`
-    should return the list of unique cultures for the names in the
-    given database.
+@pytest.mark.parametrize('fn,expected', UNIQUE_VALUES)
+def test_get_unique_values_with_path(db_path, fn, expected):
+    """Given a path to a database, :func:`mkname.db.get_cultures` and
+    :func:`mkname.db.get_kinds` should return the unique values for
+    the names in the given database.
     """
-    db_path = 'tests/data/names.db'
-    assert db.get_cultures(db_path) == (
-        'bacon',
-        'pancakes',
-        'porridge',
-    )
+    assert fn(db_path) == expected
 
 
-def test_get_cultures_without_connection_or_path(test_db):
-    """When called, :func:`mkname.db.get_cultures` should return the
-    list of unique cultures for the names in the default database.
+@pytest.mark.parametrize('fn,expected', UNIQUE_VALUES)
+def test_get_unique_values_without_connection_or_path(
+    test_db, fn, expected
+):
+    """When called, :func:`mkname.db.get_cultures` and
+    :func:`mkname.db.get_kinds` should return the unique values
+    for the names in the default database.
     """
-    assert db.get_cultures() == (
-        'bacon',
-        'pancakes',
-        'porridge',
-    )
-
-
-def test_get_kinds(con):
-    """Given a connection, :func:`mkname.db.get_kinds` should return
-    the list of unique kinds of names in the given database.
-    """
-    assert db.get_kinds(con) == (
-        'given',
-        'surname',
-    )
-
-
-def test_get_kinds_with_path():
-    """Given a connection, :func:`mkname.db.get_kinds` should return
-    the list of unique kinds of names in the given database.
-    """
-    db_path = 'tests/data/names.db'
-    assert db.get_kinds(db_path) == (
-        'given',
-        'surname',
-    )
-
-
-def test_get_kinds_without_connection_or_path(test_db):
-    """When called, :func:`mkname.db.get_kinds` should return the list
-    of unique kinds of names in the default database.
-    """
-    assert db.get_kinds() == (
-        'given',
-        'surname',
-    )
+    assert fn() == expected
 
 
-def test_get_names_by_kind(con):
+def test_get_names_by_kind(con, test_names):
     """When given a database connection and a kind,
     :func:`mkname.db.get_names_by_kind` should return the
     names of that kind in the given database as a tuple.
     """
-    # Expected value.
     kind = 'surname'
-    assert db.get_names_by_kind(con, kind) == (
-        m.Name(
-            3,
-            'tomato',
-            'mushrooms',
-            'pancakes',
-            2000,
-            'sausage',
-            'surname'
-        ),
-    )
-
-
-def test_get_names_by_kind_with_path():
+    assert db.get_names_by_kind(con, kind) == (test_names[2],)
+
+
+def test_get_names_by_kind_with_path(db_path, test_names):
     """When given a path and a kind, :func:`mkname.db.get_names_by_kind`
     should return the names of that kind in the given database as a tuple.
     """
-    # Expected value.
-    db_path = 'tests/data/names.db'
     kind = 'surname'
-    assert db.get_names_by_kind(db_path, kind) == (
-        m.Name(
-            3,
-            'tomato',
-            'mushrooms',
-            'pancakes',
-            2000,
-            'sausage',
-            'surname'
-        ),
-    )
-
-
-def test_get_names_by_kind_without_connection_or_path(test_db):
+    assert db.get_names_by_kind(db_path, kind) == (test_names[2],)
+
+
+def test_get_names_by_kind_without_connection_or_path(
+    test_db, test_names
+):
     """When given a kind, :func:`mkname.db.get_names_by_kind`
     should return the names of that kind in the default database
     as a tuple.
     """
-    # Expected value.
     kind = 'surname'
-    assert db.get_names_by_kind(kind=kind) == (
-        m.Name(
-            3,
-            'tomato',
-            'mushrooms',
-            'pancakes',
-            2000,
-            'sausage',
-            'surname'
-        ),
-    )
+    assert db.get_names_by_kind(kind=kind) == (test_names[2],)
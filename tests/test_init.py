@@ -6,6 +6,7 @@ Unit tests for :mod:`mkname.init`.
 """
 import configparser
 import filecmp
+import os
 from pathlib import Path
 
 import pytest
@@ -14,22 +15,54 @@ import mkname.constants as c
 from mkname import init
 
 
+# Common data.
+DEFAULT_DB = Path(c.DEFAULT_DB)
+
+
+# Utility functions.
+def parse_config(data):
+    """Parse the mkname sections from the contents of a configuration
+    file without rereading it from disk.
+    """
+    config = configparser.ConfigParser()
+    config.read_string(data.decode())
+    keys = ['mkname', 'mkname_files']
+    return {k: dict(config[k]) for k in config if k in keys}
+
+
 # Fixtures.
+@pytest.fixture(scope='session')
+def load_config_bytes(data_dir):
+    """The contents of the test configuration file."""
+    return (data_dir / 'test_load_config.conf').read_bytes()
+
+
+@pytest.fixture(scope='session')
+def use_config_bytes(data_dir):
+    """The contents of the partial test configuration file."""
+    return (data_dir / 'test_use_config.cfg').read_bytes()
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp(monkeypatch, tmp_path):
+    """Run each test in its own temporary directory, so configuration
+    files staged in the current working directory don't leak between
+    tests and tests can run in parallel.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
-def config_directory():
+def config_directory(load_config_bytes):
     path = Path('_test_config_directory')
     path.mkdir()
-    link = path / 'spam.cfg'
-    config_path = Path('tests/data/test_load_config.conf')
-    link.hardlink_to(config_path)
-    yield path
-    link.unlink()
-    for child in path.iterdir():
-        child.unlink()
-    path.rmdir()
+    config_path = path / 'spam.cfg'
+    config_path.write_bytes(load_config_bytes)
+    return path
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def default_config():
     """Pulls the default configuration values from the config file."""
     config = configparser.ConfigParser()
@@ -38,82 +71,47 @@ def default_config():
     return {k: dict(config[k]) for k in config if k in keys}
 
 
-@pytest.fixture
-def given_config():
-    """Pulls the default configuration values from the config file."""
-    config = configparser.ConfigParser()
-    config.read('tests/data/test_load_config.conf')
-    keys = ['mkname', 'mkname_files']
-    return {k: dict(config[k]) for k in config if k in keys}
+@pytest.fixture(scope='session')
+def given_config(load_config_bytes):
+    """Pulls the test configuration values from the config file."""
+    return parse_config(load_config_bytes)
 
 
 @pytest.fixture
-def local_config():
-    """Moves a config file into the current working directory,
-    yields the contents of that config, then cleans up.
+def local_config(load_config_bytes):
+    """Moves a config file into the current working directory and
+    returns the contents of that config.
     """
-    # Create the test config in the CWD.
-    path = Path('tests/data/test_load_config.conf')
-    link = Path('mkname.cfg')
-    link.hardlink_to(path)
-
-    # Send the contents of the config to the test.
-    config = configparser.ConfigParser()
-    config.read(link)
-    keys = ['mkname', 'mkname_files']
-    yield {k: dict(config[k]) for k in config if k in keys}
-
-    # Clean up after test.
-    if link.exists():
-        link.unlink()
+    path = Path('mkname.cfg')
+    path.write_bytes(load_config_bytes)
+    return parse_config(load_config_bytes)
 
 
 @pytest.fixture
 def local_db_loc():
-    loc = Path('test_names.db')
-    yield loc
-    if loc.exists():
-        loc.unlink()
+    return Path('test_names.db')
 
 
 @pytest.fixture
-def partial_local_config():
-    """Moves a partial config file into the current working directory,
-    yields the contents of that config, then cleans up.
+def partial_local_config(use_config_bytes):
+    """Moves a partial config file into the current working directory
+    and returns the contents of that config.
     """
-    # Create the test config in the CWD.
-    path = Path('tests/data/test_use_config.cfg')
-    link = Path('mkname.conf')
-    link.hardlink_to(path)
-
-    # Send the contents of the config to the test.
-    config = configparser.ConfigParser()
-    config.read(link)
-    keys = ['mkname', 'mkname_files']
-    yield {k: dict(config[k]) for k in config if k in keys}
-
-    # Clean up after test.
-    if link.exists():
-        link.unlink()
+    path = Path('mkname.conf')
+    path.write_bytes(use_config_bytes)
+    return parse_config(use_config_bytes)
 
 
 @pytest.fixture
 def not_exist_config():
-    path = Path('_test_given_path_does_not_exist.ini')
-    yield path
-    if path.exists():
-        path.unlink()
+    return Path('_test_given_path_does_not_exist.ini')
 
 
 @pytest.fixture
 def empty_directory():
     path = Path('_test_empty_directory')
     path.mkdir()
-    yield path
-    for child in path.iterdir():
-        child.unlink()
-    if path.exists():
-        path.rmdir()
+    return path
 
 
 # Test get_config.
@@ -124,12 +122,13 @@ def test_get_config(default_config):
     assert init.get_config() == default_config
 
 
-def test_get_config_with_given_path(given_config):
-    """If given a path to a configuration file,
-    :func:`mkname.init.get_config` should load the
-    configuration from that file.
+@pytest.mark.parametrize('loc_type', [Path, str], ids=['path', 'str'])
+def test_get_config_with_given_path(given_config, data_dir, loc_type):
+    """If given a path to a configuration file as a :class:`str` or
+    :class:`pathlib.Path`, :func:`mkname.init.get_config` should load
+    the configuration from that file.
     """
-    path = Path('tests/data/test_load_config.conf')
+    path = loc_type(data_dir / 'test_load_config.conf')
     assert init.get_config(path) == given_config
 
 
@@ -174,15 +173,6 @@ def test_get_config_with_given_path_is_empty_directory(
     assert init.get_config(path) == default_config
 
 
-def test_get_config_with_given_str(given_config):
-    """If given a str with the path to a configuration file,
-    :func:`mkname.init.get_config` should load the configuration
-    from that file.
-    """
-    path = 'tests/data/test_load_config.conf'
-    assert init.get_config(path) == given_config
-
-
 def test_get_config_with_local(local_config):
     """If there is a configuration file in the current working directory,
     :func:`mkname.init.get_config` should load the configuration from
@@ -197,38 +187,99 @@ def test_get_config_with_partial_local(partial_local_config, default_config):
     that file. If the config doesn't have values for all possible keys,
     the missing keys should have the default values.
     """
-    config = default_config
-    config.update(partial_local_config)
+    config = {**default_config, **partial_local_config}
     assert init.get_config() == config
 
 
+# Test read_config.
+def test_read_config_after_change(load_config_bytes, use_config_bytes):
+    """If a configuration file changes after it has been read,
+    :func:`mkname.init.read_config` should return the new values
+    rather than the cached ones.
+    """
+    path = Path('spam.cfg')
+    path.write_bytes(load_config_bytes)
+    assert init.read_config(path) == parse_config(load_config_bytes)
+
+    path.write_bytes(use_config_bytes)
+    assert init.read_config(path) == parse_config(use_config_bytes)
+
+
+def test_read_config_after_change_same_size(tmp_path):
+    """If a configuration file is rewritten with different contents of
+    the same size, :func:`mkname.init.read_config` should use the new
+    modification time to notice the change and return the new values.
+    """
+    path = tmp_path / 'spam.cfg'
+    path.write_text('[mkname]\nconsonants = bcd\n')
+    stat = path.stat()
+    assert init.read_config(path) == {'mkname': {'consonants': 'bcd'}}
+
+    path.write_text('[mkname]\nconsonants = xyz\n')
+    mtime = stat.st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+    assert path.stat().st_size == stat.st_size
+    assert init.read_config(path) == {'mkname': {'consonants': 'xyz'}}
+
+
+def test_read_config_relative_path_in_different_directories(
+    tmp_path, monkeypatch
+):
+    """The same relative path read from two working directories names
+    two files, so :func:`mkname.init.read_config` should return the
+    contents of each file, even when the files have the same size and
+    modification time.
+    """
+    mtime = 1_600_000_000_000_000_000
+    names = ('spam', 'eggs')
+    for name in names:
+        path = tmp_path / name / 'mkname.cfg'
+        path.parent.mkdir()
+        path.write_text(f'[mkname]\nconsonants = {name}\n')
+        os.utime(path, ns=(mtime, mtime))
+
+    for name in names:
+        monkeypatch.chdir(tmp_path / name)
+        result = init.read_config(Path('mkname.cfg'))
+        assert result == {'mkname': {'consonants': name}}
+
+
+def test_read_config_returns_copy(data_dir):
+    """Changing the configuration returned by
+    :func:`mkname.init.read_config` should not change the value
+    returned by later reads of the same file.
+    """
+    path = data_dir / 'test_load_config.conf'
+    config = init.read_config(path)
+    config['mkname']['consonants'] = 'xyz'
+    assert init.read_config(path)['mkname']['consonants'] == 'bcd'
+
+
 # Test init_db.
 def test_get_db():
     """By default, :func:`mkname.init.get_db` should return the path to
     the default database.
     """
-    assert init.get_db() == Path(c.DEFAULT_DB)
+    assert init.get_db() == DEFAULT_DB
 
 
-def test_get_db_with_path_and_exists():
-    """Given the path to a database as a :class:`pathlib.Path`,
-    :func:`mkname.init.get_db` should check if the database exists
-    and return the path to the db.
+@pytest.mark.parametrize('loc_type', [Path, str], ids=['path', 'str'])
+def test_get_db_with_path_and_exists(db_path, loc_type):
+    """Given the path to a database as a :class:`str` or
+    :class:`pathlib.Path`, :func:`mkname.init.get_db` should check
+    if the database exists and return the path to the db.
     """
-    test_db_loc = Path('tests/data/names.db')
-    assert init.get_db(test_db_loc) == test_db_loc
+    assert init.get_db(loc_type(db_path)) == db_path
 
 
-def test_get_db_with_path_is_directory_and_db_exists():
+def test_get_db_with_path_is_directory_and_db_exists(data_dir, db_path):
     """Given the path to a database as a :class:`pathlib.Path`,
     :func:`mkname.init.get_db` should check if the database exists
     and return the path to the db. If the path is a directory
     containing a file named `names.db`, it should return the path
     to that file.
     """
-    test_dir_loc = Path('tests/data')
-    test_db_loc = Path('tests/data/names.db')
-    assert init.get_db(test_dir_loc) == test_db_loc
+    assert init.get_db(data_dir) == db_path
 
 
 def test_init_db_with_path_and_not_exists(local_db_loc):
@@ -239,13 +290,4 @@ def test_init_db_with_path_and_not_exists(local_db_loc):
     to the new database returned.
     """
     assert init.get_db(local_db_loc) == local_db_loc
-    assert filecmp.cmp(Path(c.DEFAULT_DB), local_db_loc, shallow=False)
-
-
-def test_get_db_with_str_and_exists():
-    """Given the path to a database as a :class:`str`,
-    :func:`mkname.init.get_db` should check if the
-    database exists and return the path to the db.
-    """
-    test_db_loc = 'tests/data/names.db'
-    assert init.get_db(test_db_loc) == Path(test_db_loc)
+    assert filecmp.cmp(DEFAULT_DB, local_db_loc, shallow=False)
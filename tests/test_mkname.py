@@ -2,59 +2,49 @@
 test_mkname
 ~~~~~~~~~~~
 """
-import configparser
-import filecmp
-import shutil
-from pathlib import Path
-
 import pytest
 
 from mkname import mkname as mn
-from mkname.constants import *
 from mkname.model import Name
 
 
-# Fixtures.
-@pytest.fixture
-def local_db_loc():
-    loc = Path('test_names.db')
-    yield loc
-    if loc.exists():
-        loc.unlink()
+# Common data.
+NAMES = tuple(Name(id, name, '', '', 0, '', '') for id, name in enumerate([
+    'Alice',
+    'Robert',
+    'Mallory',
+    'Donatello',
+    'Michealangelo',
+    'Leonardo',
+    'Raphael',
+]))
 
 
-@pytest.fixture
+# Fixtures.
+@pytest.fixture(scope='session')
 def names():
-    return [Name(id, name, '', '', 0, '', '') for id, name in enumerate([
-        'Alice',
-        'Robert',
-        'Mallory',
-        'Donatello',
-        'Michealangelo',
-        'Leonardo',
-        'Raphael',
-    ])]
+    return NAMES
 
 
 # Building names test cases.
-def test_build_compound_name(names, mocker):
+def test_build_compound_name(names, mock_roll):
     """Given a sequence of names, build_compound_name() returns a
     name constructed from the list.
     """
-    mocker.patch('yadr.roll', side_effect=[4, 3])
+    mock_roll([4, 3])
     assert mn.build_compound_name(names) == 'Dallory'
 
 
-def test_build_from_syllables(names, mocker):
+def test_build_from_syllables(names, mock_roll):
     """Given a sequence of names, return a name build from one
     syllable from each name.
     """
-    mocker.patch('yadr.roll', side_effect=[2, 1, 5, 2, 1, 3])
+    mock_roll([2, 1, 5, 2, 1, 3])
     num_syllables = 3
     assert mn.build_from_syllables(num_syllables, names) == 'Ertalan'
 
 
-def test_select_random_name(names, mocker):
+def test_select_random_name(names, mock_roll):
     """Given a list of names, return a random name."""
-    mocker.patch('yadr.roll', side_effect=[4,])
+    mock_roll([4,])
     assert mn.select_name(names) == 'Donatello'
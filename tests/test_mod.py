@@ -4,12 +4,14 @@ test_mod
 
 Unit tests for the mkname.mod function.
 """
+import pytest
+
 from mkname import mod
 
 
 # Core test functions.
 def add_letters_test(
-    mocker,
+    mock_roll,
     base,
     letter_roll,
     position_roll,
@@ -29,139 +31,99 @@ def add_letters_test(
         count_roll,
         *index_rolls,
     ]
-    mocker.patch('yadr.roll', side_effect=rolls)
+    mock_roll(rolls)
     return mod.add_letters(base)
 
 
-def add_punctuation_test(mocker, name, rolls, **kwargs):
+def add_punctuation_test(mock_roll, name, rolls, **kwargs):
     """Run a standard add_punctuation test."""
-    mocker.patch('yadr.roll', side_effect=rolls)
+    mock_roll(rolls)
     return mod.add_punctuation(name, **kwargs)
 
 
-def simple_mod_test(mocker, mod_fn, base, rolls):
+def simple_mod_test(mock_roll, mod_fn, base, rolls):
     """Core of the simple modifier (mod) tests."""
-    mocker.patch('yadr.roll', side_effect=rolls)
+    mock_roll(rolls)
     return mod_fn(base)
 
 
 # Tests for add_letters.
-def test_add_letters_append_letter_when_ends_with_vowel(mocker):
-    """When the given base ends with a vowel, the scifi letter should
-    be appended to the name if it's added to the end of the name.
-    """
-    base = 'Steve'
-    letter_roll = 4
-    position_roll = 6
-    result = add_letters_test(mocker, base, letter_roll, position_roll)
-    assert result == 'Stevez'
-
-
-def test_add_letters_prepend_letter_when_starts_with_vowel(mocker):
-    """When the given base name starts with a vowel, the scifi letter
-    should be prepended to the name if it's added to the front of the
-    name.
-    """
-    base = 'Adam'
-    letter_roll = 3
-    position_roll = 1
-    result = add_letters_test(mocker, base, letter_roll, position_roll)
-    assert result == 'Xadam'
-
-
-def test_add_letters_replace_end_when_ends_with_consonant(mocker):
-    """When the given base name starts with a consonant, the scifi
-    letter should replace the first letter if it's added to the
-    front of the name.
-    """
-    base = 'Adam'
-    letter_roll = 4
-    position_roll = 6
-    result = add_letters_test(mocker, base, letter_roll, position_roll)
-    assert result == 'Adaz'
-
-
-def test_add_letters_replace_random_letter(mocker):
-    """When the given base name starts with a consonant, the scifi
-    letter should replace the first letter if it's added to the
-    front of the name.
-    """
-    base = 'Adam'
-    result = add_letters_test(
-        mocker,
-        base,
-        letter_roll=1,
-        position_roll=11,
-        wild_roll=3,
-        index_roll=20,
-        count_roll=3,
-        index_rolls=[1, 3, 3]
-    )
-    assert result == 'Kdkm'
-
-
-def test_add_letters_replace_start_when_starts_with_consonant(mocker):
-    """When the given base name starts with a consonant, the scifi
-    letter should replace the first letter if it's added to the
-    front of the name.
-    """
-    base = 'Steve'
-    letter_roll = 3
-    position_roll = 1
-    result = add_letters_test(mocker, base, letter_roll, position_roll)
-    assert result == 'Xteve'
+@pytest.mark.parametrize('base,rolls,expected', [
+    pytest.param(
+        'Steve',
+        {'letter_roll': 4, 'position_roll': 6},
+        'Stevez',
+        id='append_when_ends_with_vowel'
+    ),
+    pytest.param(
+        'Adam',
+        {'letter_roll': 3, 'position_roll': 1},
+        'Xadam',
+        id='prepend_when_starts_with_vowel'
+    ),
+    pytest.param(
+        'Adam',
+        {'letter_roll': 4, 'position_roll': 6},
+        'Adaz',
+        id='replace_end_when_ends_with_consonant'
+    ),
+    pytest.param(
+        'Adam',
+        {
+            'letter_roll': 1,
+            'position_roll': 11,
+            'wild_roll': 3,
+            'index_roll': 20,
+            'count_roll': 3,
+            'index_rolls': [1, 3, 3],
+        },
+        'Kdkm',
+        id='replace_random_letter'
+    ),
+    pytest.param(
+        'Steve',
+        {'letter_roll': 3, 'position_roll': 1},
+        'Xteve',
+        id='replace_start_when_starts_with_consonant'
+    ),
+])
+def test_add_letters(mock_roll, base, rolls, expected):
+    """When the scifi letter is added to the end of the name, it
+    should be appended if the name ends with a vowel and replace the
+    last letter if it ends with a consonant. When it's added to the
+    front, it should be prepended if the name starts with a vowel
+    and replace the first letter if it starts with a consonant. It
+    can also replace random letters in the name.
+    """
+    result = add_letters_test(mock_roll, base, **rolls)
+    assert result == expected
 
 
 # Tests for add_punctuation.
-def test_add_puctuation(mocker):
+@pytest.mark.parametrize('rolls,kwargs,expected', [
+    pytest.param([1, 2], {}, "S'Pam", id='default'),
+    pytest.param([3,], {'index': 3}, 'Spa.M', id='at_index'),
+    pytest.param(
+        [1, 4], {'cap_after': False}, "Spa'm",
+        id='do_not_cap_after_mark'
+    ),
+    pytest.param(
+        [1, 2], {'cap_before': False}, "s'Pam",
+        id='do_not_cap_before_mark'
+    ),
+    pytest.param([2, 1], {}, '-Spam', id='start_of_name'),
+])
+def test_add_punctuation(mock_roll, rolls, kwargs, expected):
     """Given a name, add a punctuation mark into the name. It
     capitalizes the first letter and the letter after the
-    punctuation mark in the name.
+    punctuation mark in the name, unless cap_before or cap_after
+    are False. Given an index, add the punctuation at that index.
+    If the selected position is in front of the name, add the mark
+    to the beginning of the name.
     """
     name = 'spam'
-    rolls = [1, 2]
-    result = add_punctuation_test(mocker, name, rolls)
-    assert result == "S'Pam"
-
-
-def test_add_puctuation_at_index(mocker):
-    """Given an index, add the punctuation at that index."""
-    name = 'spam'
-    rolls = [3,]
-    index = 3
-    result = add_punctuation_test(mocker, name, rolls, index=index)
-    assert result == 'Spa.M'
-
-
-def test_add_punctuation_do_not_cap_after_mark(mocker):
-    """If False is passed for cap_after, then the letter after the mark
-    isn't capitalized.
-    """
-    name = 'spam'
-    rolls = [1,4]
-    cap_after = False
-    result = add_punctuation_test(mocker, name, rolls, cap_after=cap_after)
-    assert result == "Spa'm"
-
-
-def test_add_punctuation_do_not_cap_before_mark(mocker):
-    """If False is passed for cap_before, then the letter before the
-    mark isn't capitalized."""
-    name = 'spam'
-    rolls = [1,2]
-    cap_before = False
-    result = add_punctuation_test(mocker, name, rolls, cap_before=cap_before)
-    assert result == "s'Pam"
-
-
-def test_add_punctuation_start_of_name(mocker):
-    """If the selected position is in front of the name, add the mark to
-    the beginning of the name.
-    """
-    name = 'spam'
-    rolls = [2, 1]
-    result = add_punctuation_test(mocker, name, rolls)
-    assert result == '-Spam'
+    result = add_punctuation_test(mock_roll, name, rolls, **kwargs)
+    assert result == expected
 
 
 # Tests for compound_name.
@@ -173,30 +135,22 @@ def test_compound_names():
 
 
 # Tests for double_letter.
-def test_double_letter_only_given_letters(mocker):
+@pytest.mark.parametrize('letters,expected', [
+    pytest.param('aeiou', 'Baacon', id='only_given_letters'),
+    pytest.param('kqxz', 'Bacon', id='given_letters_not_in_name'),
+])
+def test_double_letter(mock_roll, letters, expected):
     """If given a string of letters, only double a letter that is in
-    that list.
-    """
-    name = 'Bacon'
-    letters = 'aeiou'
-    roll = [1,]
-    mocker.patch('yadr.roll', side_effect=roll)
-    assert mod.double_letter(name, letters) == 'Baacon'
-
-
-def test_double_letter_given_letters_not_in_name(mocker):
-    """If given a string of letters and the name doesn't have any of
-    those letters, return the name.
+    that list. If the name doesn't have any of those letters, return
+    the name.
     """
     name = 'Bacon'
-    letters = 'kqxz'
-    roll = [1,]
-    mocker.patch('yadr.roll', side_effect=roll)
-    assert mod.double_letter(name, letters) == name
+    mock_roll([1,])
+    assert mod.double_letter(name, letters) == expected
 
 
 # Test translate_characters.
-def test_translate_characters(mocker):
+def test_translate_characters(mock_roll):
     """Given a mapping that maps characters in the name to different
     characters, return the translated name.
     """
@@ -206,105 +160,77 @@ def test_translate_characters(mocker):
         'o': 'a',
     }
     roll = [1,]
-    mocker.patch('yadr.roll', side_effect=roll)
+    mock_roll(roll)
     assert mod.translate_characters(name, char_map) == 'sanatella'
 
 
 # Test simple modifiers.
-def test_double_vowel(mocker):
+def test_double_vowel(mock_roll):
     """Given a base name, double_vowel() should double a vowel within
     the name.
     """
     mod_fn = mod.double_vowel
     base = 'Bacon'
     rolls = [1,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
+    result = simple_mod_test(mock_roll, mod_fn, base, rolls)
     assert result == 'Baacon'
 
 
-def test_garble(mocker):
+def test_garble(mock_roll):
     """Given a base name, garble() should garble it by converting a
     section in the middle to base64.
     """
     mod_fn = mod.garble
     base = 'Spam'
     rolls = [2,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
+    result = simple_mod_test(mock_roll, mod_fn, base, rolls)
     assert result == 'Scaam'
 
 
-def test_make_scifi_append_letter_when_ends_with_vowel(mocker):
-    """When the given base ends with a vowel, the scifi letter should
-    be appended to the name if it's added to the end of the name.
-    """
-    mod_fn = mod.make_scifi
-    base = 'Steve'
-    rolls = [4, 6, 0,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
-    assert result == 'Stevez'
-
-
-def test_make_scifi_prepend_letter_when_starts_with_vowel(mocker):
-    """When the given base name starts with a vowel, the scifi letter
-    should be prepended to the name if it's added to the front of the
-    name.
-    """
-    mod_fn = mod.make_scifi
-    base = 'Adam'
-    rolls = [3, 1, 0,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
-    assert result == 'Xadam'
-
-
-def test_make_scifi_replace_end_when_ends_with_consonant(mocker):
-    """When the given base name starts with a consonant, the scifi
-    letter should replace the first letter if it's added to the
-    front of the name.
-    """
-    mod_fn = mod.make_scifi
-    base = 'Adam'
-    rolls = [4, 6, 0,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
-    assert result == 'Adaz'
-
-
-def test_make_scifi_replace_random_letter(mocker):
-    """When the given base name starts with a consonant, the scifi
-    letter should replace the first letter if it's added to the
-    front of the name.
-    """
-    mod_fn = mod.make_scifi
-    base = 'Adam'
-    rolls = [1, 11, 20, 3, 3, 1, 3, 3]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
-    assert result == 'Kdkm'
-
-
-def test_make_scifi_replace_start_when_starts_with_consonant(mocker):
-    """When the given base name starts with a consonant, the scifi
-    letter should replace the first letter if it's added to the front
-    of the name.
+@pytest.mark.parametrize('base,rolls,expected', [
+    pytest.param(
+        'Steve', [4, 6, 0,], 'Stevez',
+        id='append_when_ends_with_vowel'
+    ),
+    pytest.param(
+        'Adam', [3, 1, 0,], 'Xadam',
+        id='prepend_when_starts_with_vowel'
+    ),
+    pytest.param(
+        'Adam', [4, 6, 0,], 'Adaz',
+        id='replace_end_when_ends_with_consonant'
+    ),
+    pytest.param(
+        'Adam', [1, 11, 20, 3, 3, 1, 3, 3], 'Kdkm',
+        id='replace_random_letter'
+    ),
+    pytest.param(
+        'Steve', [3, 1, 0,], 'Xteve',
+        id='replace_start_when_starts_with_consonant'
+    ),
+])
+def test_make_scifi(mock_roll, base, rolls, expected):
+    """Given a base name, make_scifi() should add a scifi letter to
+    the name, following the same placement rules as add_letters().
     """
     mod_fn = mod.make_scifi
-    base = 'Steve'
-    rolls = [3, 1, 0,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
-    assert result == 'Xteve'
+    result = simple_mod_test(mock_roll, mod_fn, base, rolls)
+    assert result == expected
 
 
-def test_vulcanize(mocker):
+def test_vulcanize(mock_roll):
     """Given a base name, vulcanize() should prefix the name with "T''"."""
     mod_fn = mod.vulcanize
     base = 'Spam'
     rolls = [5, 0,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
+    result = simple_mod_test(mock_roll, mod_fn, base, rolls)
     assert result == "T'Spam"
 
 
-def test_vulcanize_not_t(mocker):
+def test_vulcanize_not_t(mock_roll):
     """One in six times, the prefix should use a letter other than "T"."""
     mod_fn = mod.vulcanize
     base = 'Spam'
     rolls = [6, 8, 0,]
-    result = simple_mod_test(mocker, mod_fn, base, rolls)
+    result = simple_mod_test(mock_roll, mod_fn, base, rolls)
     assert result == "Su'Spam"